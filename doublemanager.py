@@ -7,14 +7,260 @@ A DoubleCMD-like application for managing Ollama models across different locatio
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
+import sys
 import json
 import hashlib
+import logging
+import mmap
 import shutil
+import time
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
+import concurrent.futures
 import threading
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    # Parses bytes directly and much faster than the stdlib; optional
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Live updates when the models folders change on disk; optional
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+log = logging.getLogger(__name__)
+
+# Refresh requests closer together than this are coalesced
+REFRESH_DEBOUNCE_MS = 150
+
+# Minimum seconds between status bar updates from a running copy
+STATUS_UPDATE_INTERVAL = 0.1
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Blob files are named after their digest, e.g. "sha256:<hex>" -> "sha256-<hex>"
+BLOB_PREFIX = "sha256-"
+
+def _blob_size(entry) -> int:
+    """Size of a config/layer entry, rejecting values the scanner can't store"""
+    size = entry.get('size', 0)
+    if not isinstance(size, int) or isinstance(size, bool):
+        raise TypeError(f"blob size is not an integer: {size!r}")
+    if not 0 <= size < 2 ** 63:
+        raise ValueError(f"blob size out of range: {size}")
+    return size
+
+def _blob_name(digest: str) -> str:
+    """Blob file name for an "algorithm:hex" digest, rejecting digests the scanner can't use"""
+    if not isinstance(digest, str):
+        raise TypeError(f"digest is not a string: {digest!r}")
+    _, sep, hexdigest = digest.partition(':')
+    if not sep or not hexdigest:
+        raise ValueError(f"malformed digest: {digest!r}")
+    return BLOB_PREFIX + hexdigest
+
+def _parse_manifest(manifest_path: str) -> Tuple[Optional[List[Tuple[str, int, str]]], Optional[str]]:
+    """Parse a manifest file into (name, size, type) blob tuples; returns (blobs, error)"""
+    try:
+        with open(manifest_path, 'rb') as f:
+            manifest = _json_loads(f.read())
+            
+        manifest_blobs = []
+        
+        # Check config blob
+        if 'config' in manifest:
+            config_digest = manifest['config']['digest']
+            blob_name = _blob_name(config_digest)
+            blob_size = _blob_size(manifest['config'])
+            manifest_blobs.append((blob_name, blob_size, 'config'))
+            
+        # Check layer blobs
+        if 'layers' in manifest:
+            for layer in manifest['layers']:
+                layer_digest = layer['digest']
+                blob_name = _blob_name(layer_digest)
+                blob_size = _blob_size(layer)
+                manifest_blobs.append((blob_name, blob_size, layer.get('mediaType', 'layer')))
+                
+        return manifest_blobs, None
+        
+    # ValueError covers JSON and UTF-8 decode errors plus malformed digests and sizes;
+    # TypeError and AttributeError come from entries of the wrong shape
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        return None, str(e)
+
+# ioctl request that reflinks one file into another (Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+def _fast_copy(src: str, dst: str):
+    """Copy a file with metadata, cloning or copying inside the kernel when possible.
+    
+    On Linux tries a FICLONE reflink, then copy_file_range. Everywhere else (Windows,
+    macOS) and if those fail it falls back to shutil.copy2.
+    """
+    # Opening dst for writing would truncate src if both are the same file
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        
+    if fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                try:
+                    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                except OSError:
+                    # Not a reflink-capable filesystem (or different filesystems)
+                    remaining = os.fstat(src_fd).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            # Short of the expected size - let copy2 redo it rather than
+                            # leave a truncated blob behind
+                            raise OSError(f"copy_file_range stopped with {remaining} bytes left")
+                        remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            # Kernel fast paths unsupported or incomplete here (e.g. EXDEV from
+            # copy_file_range across filesystems on older kernels). On Linux copy2 already
+            # copies with os.sendfile, so the data still stays in kernel space
+            pass
+            
+    shutil.copy2(src, dst)
+
+def _sha256(path: str) -> str:
+    """Hex SHA-256 of a file, without pulling it through Python-level reads"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+            
+        h = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        return h.hexdigest()
+
+def _verify_blob(blob_path: str) -> bool:
+    """Check that a blob's contents match the digest in its file name"""
+    expected = os.path.basename(blob_path)[len(BLOB_PREFIX):]
+    return _sha256(blob_path) == expected
+
+@dataclass(slots=True)
+class ModelIndex:
+    """Models, versions and blobs of one models folder, stored as flat parallel columns.
+    
+    Versions of model m are version_start[m]:version_start[m + 1] and blobs of
+    version v are blob_start[v]:blob_start[v + 1].
+    """
+    model_names: List[str] = field(default_factory=list)
+    version_start: array = field(default_factory=lambda: array('i', [0]))
+    version_names: List[str] = field(default_factory=list)
+    manifest_paths: List[str] = field(default_factory=list)
+    blob_start: array = field(default_factory=lambda: array('i', [0]))
+    blob_names: List[str] = field(default_factory=list)
+    blob_sizes: array = field(default_factory=lambda: array('q'))
+    blob_size_strs: List[str] = field(default_factory=list)
+    blob_types: List[str] = field(default_factory=list)
+    blob_exists: bytearray = field(default_factory=bytearray)
+    model_ids: Dict[str, int] = field(default_factory=dict)
+    
+    def __len__(self):
+        return len(self.model_names)
+        
+    def add_model(self, model_name: str) -> int:
+        self.model_ids[model_name] = len(self.model_names)
+        self.model_names.append(model_name)
+        self.version_start.append(self.version_start[-1])
+        return self.model_ids[model_name]
+        
+    def add_version(self, version_name: str, manifest_path: str, manifest_blobs, existing_blobs):
+        """Append a version (and its blobs) to the most recently added model"""
+        self.version_names.append(version_name)
+        self.manifest_paths.append(manifest_path)
+        self.version_start[-1] += 1
+        
+        for blob_name, blob_size, size_str, blob_type in manifest_blobs:
+            self.blob_names.append(blob_name)
+            self.blob_sizes.append(blob_size)
+            self.blob_size_strs.append(size_str)
+            self.blob_types.append(blob_type)
+            self.blob_exists.append(blob_name in existing_blobs)
+        self.blob_start.append(self.blob_start[-1] + len(manifest_blobs))
+        
+    def versions(self, model_idx: int) -> range:
+        return range(self.version_start[model_idx], self.version_start[model_idx + 1])
+        
+    def blobs(self, version_idx: int) -> range:
+        return range(self.blob_start[version_idx], self.blob_start[version_idx + 1])
+        
+    def find_version(self, model_idx: int, version_name: str) -> Optional[int]:
+        for version_idx in self.versions(model_idx):
+            if self.version_names[version_idx] == version_name:
+                return version_idx
+        return None
+        
+    def model_signature(self, model_idx: int) -> tuple:
+        """Everything the tree shows below a model, for cheap change detection"""
+        signature = []
+        for version_idx in self.versions(model_idx):
+            blobs = self.blobs(version_idx)
+            signature.append((
+                self.version_names[version_idx],
+                self.manifest_paths[version_idx],
+                tuple(self.blob_names[blobs.start:blobs.stop]),
+                self.blob_sizes[blobs.start:blobs.stop].tobytes(),
+                bytes(self.blob_exists[blobs.start:blobs.stop]),
+            ))
+        return tuple(signature)
+
+class _ModelsDirHandler:
+    """watchdog event handler that forwards changes under a pane's folder to the UI thread"""
+    
+    # Opened/closed events fire on our own manifest reads, so only content changes count
+    CHANGE_EVENTS = ('created', 'deleted', 'modified', 'moved')
+    
+    def __init__(self, manager, pane, watched_path):
+        self.manager = manager
+        self.pane = pane
+        self.watched_path = watched_path
+        # A blob being pulled fires thousands of events; at most one callback is queued at a time
+        self._scheduled = False
+        self._lock = threading.Lock()
+        
+    def _is_relevant(self, path):
+        rel_path = os.path.relpath(os.fsdecode(path), self.watched_path)
+        return rel_path.split(os.sep, 1)[0] in ('manifests', 'blobs')
+        
+    def dispatch(self, event):
+        if event.event_type not in self.CHANGE_EVENTS:
+            return
+        paths = (event.src_path, getattr(event, 'dest_path', ''))
+        if not any(path and self._is_relevant(path) for path in paths):
+            return
+            
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.manager.root.after(0, self._deliver)
+        
+    def _deliver(self):
+        with self._lock:
+            self._scheduled = False
+        self.manager._invalidate_path(self.pane, self.watched_path)
+
 class OllamaModelManager:
     def __init__(self, root):
         self.root = root
@@ -26,8 +272,30 @@ class OllamaModelManager:
         self.right_path = tk.StringVar()
         
         # Model data storage
-        self.left_models = {}
-        self.right_models = {}
+        self.left_models = ModelIndex()
+        self.right_models = ModelIndex()
+        
+        # Parsed manifest blobs as (name, size, size_str, type), keyed by (path, mtime_ns, size)
+        # and shared by both panes
+        self._manifest_cache: Dict[Tuple[str, int, int], List[Tuple[str, int, str, str]]] = {}
+        
+        # Shared worker pool for scans and file operations
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="ollama-io")
+        # Blob copies fan out from copy tasks already running on _io_pool, so they get their own
+        # pool - waiting on the same pool could deadlock once all its workers are copy tasks
+        self._copy_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="ollama-copy")
+        self._refresh_futures = {'left': None, 'right': None}
+        self._refresh_pending = {'left': False, 'right': False}
+        self._refresh_after_id = {'left': None, 'right': None}
+        
+        # Filesystem watchers, re-pointed whenever a pane is refreshed on a different folder
+        self._observers = {'left': None, 'right': None}
+        self._watched_paths = {'left': None, 'right': None}
+        
+        # Tree item id -> (text, parent text, grandparent text), kept in step with the trees
+        # so selections can be resolved without Tcl round-trips
+        self._node_meta = {'left': {}, 'right': {}}
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         self.setup_ui()
         self.setup_default_paths()
@@ -86,11 +354,11 @@ class OllamaModelManager:
         self.left_tree.column("size", width=100)
         self.left_tree.column("status", width=100)
         
-        left_scrollbar = ttk.Scrollbar(left_tree_frame, orient=tk.VERTICAL, command=self.left_tree.yview)
-        self.left_tree.configure(yscrollcommand=left_scrollbar.set)
+        self.left_scrollbar = ttk.Scrollbar(left_tree_frame, orient=tk.VERTICAL, command=self.left_tree.yview)
+        self.left_tree.configure(yscrollcommand=self.left_scrollbar.set)
         
         self.left_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        left_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.left_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Right pane (similar structure)
         right_frame = ttk.LabelFrame(pane_container, text="Right Pane", padding=5)
@@ -122,11 +390,11 @@ class OllamaModelManager:
         self.right_tree.column("size", width=100)
         self.right_tree.column("status", width=100)
         
-        right_scrollbar = ttk.Scrollbar(right_tree_frame, orient=tk.VERTICAL, command=self.right_tree.yview)
-        self.right_tree.configure(yscrollcommand=right_scrollbar.set)
+        self.right_scrollbar = ttk.Scrollbar(right_tree_frame, orient=tk.VERTICAL, command=self.right_tree.yview)
+        self.right_tree.configure(yscrollcommand=self.right_scrollbar.set)
         
         self.right_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        right_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.right_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Context menus
         self.setup_context_menus()
@@ -150,6 +418,10 @@ class OllamaModelManager:
         self.left_tree.bind("<Button-3>", lambda e: self.show_context_menu(e, 'left'))
         self.right_tree.bind("<Button-3>", lambda e: self.show_context_menu(e, 'right'))
         
+        # Populate children on demand
+        self.left_tree.bind("<<TreeviewOpen>>", lambda e: self._on_tree_open('left'))
+        self.right_tree.bind("<<TreeviewOpen>>", lambda e: self._on_tree_open('right'))
+        
     def setup_default_paths(self):
         # Set default paths based on OS
         if os.name == 'nt':  # Windows
@@ -189,58 +461,193 @@ class OllamaModelManager:
         self.refresh_pane('right')
         
     def refresh_pane(self, pane):
+        # No update() here - the status repaints once the main loop idles, and a nested
+        # event loop per call is exactly what bursts of refreshes must not trigger
         self.status_var.set(f"Refreshing {pane} pane...")
-        self.root.update()
         
-        # Run in thread to prevent UI freezing
-        thread = threading.Thread(target=self._refresh_pane_thread, args=(pane,))
-        thread.daemon = True
-        thread.start()
+        # Collapse refreshes requested in quick succession into a single scan
+        prev = self._refresh_after_id[pane]
+        if prev is not None:
+            self.root.after_cancel(prev)
+        self._refresh_after_id[pane] = self.root.after(REFRESH_DEBOUNCE_MS, self._start_refresh, pane)
+        
+    def _start_refresh(self, pane):
+        self._refresh_after_id[pane] = None
+        self._watch_pane(pane, self.left_path.get() if pane == 'left' else self.right_path.get())
+        
+        # A scan is already running for this pane - rescan once it finishes instead of piling up
+        future = self._refresh_futures[pane]
+        if future is not None and not future.done():
+            self._refresh_pending[pane] = True
+            return
+            
+        # Run in worker pool to prevent UI freezing
+        future = self._io_pool.submit(self._refresh_pane_thread, pane)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_refresh_done, pane))
+        self._refresh_futures[pane] = future
+        
+    def _on_refresh_done(self, pane):
+        if self._refresh_pending[pane]:
+            self._refresh_pending[pane] = False
+            self._start_refresh(pane)
+            
+    def _watch_pane(self, pane, path):
+        # Already watching this folder; otherwise (re)try, since a missing folder or a failed
+        # start leaves the pane unwatched and the next refresh should try again
+        if Observer is None or (self._observers[pane] is not None and path == self._watched_paths[pane]):
+            return
+            
+        observer = self._observers[pane]
+        if observer is not None:
+            observer.stop()
+        self._observers[pane] = None
+        self._watched_paths[pane] = None
+        
+        if not os.path.isdir(path):
+            return
+            
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_ModelsDirHandler(self, pane, path), path, recursive=True)
+            observer.start()
+        except OSError as e:  # e.g. out of inotify watches
+            log.warning("cannot watch %s: %s", path, e)
+            return
+        self._observers[pane] = observer
+        self._watched_paths[pane] = path
+        
+    def _invalidate_path(self, pane, watched_path):
+        """Refresh a pane after a change under its manifests or blobs folder"""
+        # Ignore stale events from a folder the pane no longer shows
+        if watched_path != self._watched_paths[pane]:
+            return
+            
+        # Debounced and served from the manifest cache, so only changed manifests are re-read
+        self.refresh_pane(pane)
         
     def _refresh_pane_thread(self, pane):
         try:
             path = self.left_path.get() if pane == 'left' else self.right_path.get()
             models = self.scan_ollama_models(path)
             
-            if pane == 'left':
-                self.left_models = models
-                tree = self.left_tree
-            else:
-                self.right_models = models
-                tree = self.right_tree
+            tree = self.left_tree if pane == 'left' else self.right_tree
             
-            # Update UI in main thread
+            # Update UI (and the models the tree is expanded from) in main thread
             self.root.after(0, self._update_tree_display, tree, models, pane)
             
         except Exception as e:
             self.root.after(0, lambda: self.status_var.set(f"Error refreshing {pane}: {str(e)}"))
             
     def _update_tree_display(self, tree, models, pane):
-        # Clear existing items
-        for item in tree.get_children():
-            tree.delete(item)
-            
-        # Add models and blobs
-        for model_name, model_data in models.items():
-            # Add model root node
-            model_item = tree.insert("", "end", text=model_name, values=("", "Model"))
-            
-            # Add versions
-            for version, version_data in model_data.get('versions', {}).items():
-                version_item = tree.insert(model_item, "end", text=f"{version}", values=("", "Version"))
+        if pane == 'left':
+            old_models = self.left_models
+            self.left_models = models
+            scrollbar = self.left_scrollbar
+        else:
+            old_models = self.right_models
+            self.right_models = models
+            scrollbar = self.right_scrollbar
+        
+        # Detach the tree while rebuilding so Tk does one layout pass instead of one per row
+        tree.configure(yscrollcommand="")
+        tree.pack_forget()
+        
+        node_meta = self._node_meta[pane]
+        existing = {node_meta[item][0]: item for item in tree.get_children() if item in node_meta}
+        
+        try:
+            # Remove models that are gone
+            for model_name, model_item in existing.items():
+                if model_name not in models.model_ids:
+                    self._delete_nodes(tree, pane, (model_item,))
+                    
+            # Patch model root nodes in place so unchanged models keep their expanded state;
+            # versions and blobs are filled in when a node is opened
+            for model_idx, model_name in enumerate(models.model_names):
+                model_item = existing.get(model_name)
                 
-                # Add blobs
-                for blob_info in version_data.get('blobs', []):
-                    blob_name = blob_info['name']
-                    blob_size = self.format_size(blob_info['size'])
-                    blob_status = "✓" if blob_info['exists'] else "✗"
-                    tree.insert(version_item, "end", text=blob_name, values=(blob_size, blob_status))
+                if model_item is None:
+                    model_item = tree.insert("", model_idx, text=model_name, values=("", "Model"))
+                    node_meta[model_item] = (model_name, None, None)
+                    if models.versions(model_idx):
+                        self._insert_placeholder(tree, model_item)
+                    continue
                     
+                tree.move(model_item, "", model_idx)
+                old_idx = old_models.model_ids.get(model_name)
+                if old_idx is None or old_models.model_signature(old_idx) != models.model_signature(model_idx):
+                    # Contents changed - collapse and re-read children on next open
+                    self._delete_nodes(tree, pane, tree.get_children(model_item))
+                    tree.item(model_item, open=False)
+                    if models.versions(model_idx):
+                        self._insert_placeholder(tree, model_item)
+        finally:
+            tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=scrollbar)
+            tree.configure(yscrollcommand=scrollbar.set)
+            
         self.status_var.set(f"Refreshed {pane} pane - {len(models)} models found")
         
-    def scan_ollama_models(self, base_path: str) -> Dict:
+    def _delete_nodes(self, tree, pane, items):
+        # Forget the node table entries of the items and everything below them
+        node_meta = self._node_meta[pane]
+        pending = list(items)
+        while pending:
+            item = pending.pop()
+            node_meta.pop(item, None)
+            pending.extend(tree.get_children(item))
+        if items:
+            tree.delete(*items)
+        
+    def _insert_placeholder(self, tree, item):
+        # Gives the node an expand arrow until its real children are inserted
+        tree.insert(item, "end", text="...", values=("", "loading"), tags=('placeholder',))
+        
+    def _on_tree_open(self, pane):
+        tree = self.left_tree if pane == 'left' else self.right_tree
+        models = self.left_models if pane == 'left' else self.right_models
+        node_meta = self._node_meta[pane]
+        
+        item = tree.focus()
+        children = tree.get_children(item)
+        if item not in node_meta or len(children) != 1 or 'placeholder' not in tree.item(children[0], 'tags'):
+            return
+        tree.delete(children[0])
+        
+        item_text, parent_text, _ = node_meta[item]
+        if parent_text is None:  # Model node - add versions
+            model_idx = models.model_ids.get(item_text)
+            if model_idx is None:
+                return
+            for version_idx in models.versions(model_idx):
+                version = models.version_names[version_idx]
+                version_item = tree.insert(item, "end", text=f"{version}", values=("", "Version"))
+                node_meta[version_item] = (version, item_text, None)
+                if models.blobs(version_idx):
+                    self._insert_placeholder(tree, version_item)
+                    
+        else:  # Version node - add blobs
+            model_idx = models.model_ids.get(parent_text)
+            if model_idx is None:
+                return
+            version_idx = models.find_version(model_idx, item_text)
+            if version_idx is None:
+                return
+            for blob_idx in models.blobs(version_idx):
+                blob_name = models.blob_names[blob_idx]
+                blob_size = models.blob_size_strs[blob_idx]
+                blob_status = "✓" if models.blob_exists[blob_idx] else "✗"
+                blob_item = tree.insert(item, "end", text=blob_name, values=(blob_size, blob_status))
+                node_meta[blob_item] = (blob_name, item_text, parent_text)
+                
+    def _snapshot_selection(self, pane, items):
+        """Resolve selected items to (item, text, parent_text, grandparent_text) in one pass"""
+        node_meta = self._node_meta[pane]
+        return [(item,) + node_meta[item] for item in items if item in node_meta]
+        
+    def scan_ollama_models(self, base_path: str) -> ModelIndex:
         """Scan for Ollama models in the given path"""
-        models = {}
+        models = ModelIndex()
         
         if not os.path.exists(base_path):
             return models
@@ -253,79 +660,88 @@ class OllamaModelManager:
             return models
             
         # Get all blob files for quick lookup
-        existing_blobs = set()
+        existing_blobs = frozenset()
         if os.path.exists(blobs_path):
-            existing_blobs = set(os.listdir(blobs_path))
+            with os.scandir(blobs_path) as it:
+                existing_blobs = frozenset(entry.name for entry in it)
             
-        # Scan model directories
-        for model_name in os.listdir(manifests_path):
-            model_dir = os.path.join(manifests_path, model_name)
-            if not os.path.isdir(model_dir):
-                continue
-                
-            models[model_name] = {'versions': {}}
-            
-            # Scan version files
-            for version_file in os.listdir(model_dir):
-                version_path = os.path.join(model_dir, version_file)
-                if not os.path.isfile(version_path):
+        model_entries_found = []
+        
+        # Scan model directories (DirEntry caches the file type, avoiding a stat per entry)
+        with os.scandir(manifests_path) as model_entries:
+            for model_entry in model_entries:
+                if not model_entry.is_dir(follow_symlinks=False):
                     continue
                     
-                try:
-                    with open(version_path, 'r', encoding='utf-8') as f:
-                        manifest = json.load(f)
-                        
-                    # Parse manifest for blobs
-                    blobs = []
-                    
-                    # Check config blob
-                    if 'config' in manifest:
-                        config_digest = manifest['config']['digest']
-                        blob_name = f"sha256-{config_digest.split(':')[1]}"
-                        blob_size = manifest['config'].get('size', 0)
-                        blobs.append({
-                            'name': blob_name,
-                            'size': blob_size,
-                            'exists': blob_name in existing_blobs,
-                            'type': 'config'
-                        })
-                        
-                    # Check layer blobs
-                    if 'layers' in manifest:
-                        for layer in manifest['layers']:
-                            layer_digest = layer['digest']
-                            blob_name = f"sha256-{layer_digest.split(':')[1]}"
-                            blob_size = layer.get('size', 0)
-                            blobs.append({
-                                'name': blob_name,
-                                'size': blob_size,
-                                'exists': blob_name in existing_blobs,
-                                'type': layer.get('mediaType', 'layer')
-                            })
+                version_entries = []
+                model_entries_found.append((model_entry.name, version_entries))
+                
+                # Scan version files
+                with os.scandir(model_entry.path) as it:
+                    for version_entry in it:
+                        if not version_entry.is_file():
+                            continue
                             
-                    models[model_name]['versions'][version_file] = {
-                        'blobs': blobs,
-                        'manifest_path': version_path
-                    }
-                    
-                except (json.JSONDecodeError, KeyError, Exception) as e:
-                    print(f"Error parsing {version_path}: {e}")
+                        # Reuse the parsed manifest unless the file was rewritten since the last scan
+                        try:
+                            st = version_entry.stat()
+                        except OSError as e:
+                            log.warning("manifest parse failed %s: %s", version_entry.path, e)
+                            continue
+                        cache_key = (version_entry.path, st.st_mtime_ns, st.st_size)
+                        version_entries.append((version_entry.name, cache_key))
+                        
+        seen_keys = {cache_key for _, version_entries in model_entries_found for _, cache_key in version_entries}
+        
+        # This scan's manifests, so a concurrent scan pruning the shared cache can't drop any
+        scanned = {}
+        to_parse = []
+        for cache_key in seen_keys:
+            manifest_blobs = self._manifest_cache.get(cache_key)
+            if manifest_blobs is None:
+                to_parse.append(cache_key)
+            else:
+                scanned[cache_key] = manifest_blobs
+                
+        # Parse new or changed manifests
+        for cache_key in to_parse:
+            manifest_blobs, error = _parse_manifest(cache_key[0])
+            if error is not None:
+                log.warning("manifest parse failed %s: %s", cache_key[0], error)
+                continue
+            # Format sizes once per parse rather than on every refresh
+            scanned[cache_key] = self._manifest_cache[cache_key] = [
+                (blob_name, blob_size, self.format_size(blob_size), blob_type)
+                for blob_name, blob_size, blob_type in manifest_blobs
+            ]
+            
+        for model_name, version_entries in model_entries_found:
+            models.add_model(model_name)
+            for version_file, cache_key in version_entries:
+                manifest_blobs = scanned.get(cache_key)
+                if manifest_blobs is None:  # Failed to parse
                     continue
                     
+                # Blobs can appear or vanish without the manifest changing, so existence is always re-checked
+                models.add_version(version_file, cache_key[0], manifest_blobs, existing_blobs)
+            
+        # Drop cached manifests under this path that were deleted or rewritten
+        manifests_prefix = manifests_path + os.sep
+        for cache_key in list(self._manifest_cache):
+            if cache_key[0].startswith(manifests_prefix) and cache_key not in seen_keys:
+                self._manifest_cache.pop(cache_key, None)
+                
         return models
         
-    def format_size(self, size_bytes: int) -> str:
+    @staticmethod
+    def format_size(size_bytes: int) -> str:
         """Format file size in human readable format"""
         if size_bytes == 0:
             return "0 B"
         
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        i = 0
-        while size_bytes >= 1024 and i < len(units) - 1:
-            size_bytes /= 1024
-            i += 1
-            
-        return f"{size_bytes:.1f} {units[i]}"
+        # Each unit is 2**10 times the previous one, so the unit follows from the bit length
+        i = min(len(SIZE_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+        return f"{size_bytes / (1 << (i * 10)):.1f} {SIZE_UNITS[i]}"
         
     def show_context_menu(self, event, pane):
         tree = self.left_tree if pane == 'left' else self.right_tree
@@ -360,55 +776,89 @@ class OllamaModelManager:
             return
             
         self.status_var.set("Copying files...")
-        self.root.update()
+        self.root.update_idletasks()
         
-        # Run copy operation in thread
-        thread = threading.Thread(target=self._copy_files_thread, args=(from_pane, selected, dest_path))
-        thread.daemon = True
-        thread.start()
+        # Run copy operation in worker pool
+        selection = self._snapshot_selection(from_pane, selected)
+        self._io_pool.submit(self._copy_files_thread, from_pane, selection, dest_path)
         
-    def _copy_files_thread(self, from_pane, selected_items, dest_path):
+    def _copy_files_thread(self, from_pane, selection, dest_path):
         try:
             src_path = self.left_path.get() if from_pane == 'left' else self.right_path.get()
             models = self.left_models if from_pane == 'left' else self.right_models
-            tree = self.left_tree if from_pane == 'left' else self.right_tree
             
-            copied_count = 0
-            copied_models = set()
+            # Progress is posted to the UI at most every STATUS_UPDATE_INTERVAL seconds
+            progress_count = 0
+            last_update = time.monotonic()
             
-            for item in selected_items:
-                item_text = tree.item(item, 'text')
-                parent = tree.parent(item)
-                grandparent = tree.parent(parent) if parent else None
-                
+            def progress(n=1):
+                nonlocal progress_count, last_update
+                progress_count += n
+                now = time.monotonic()
+                if now - last_update >= STATUS_UPDATE_INTERVAL:
+                    last_update = now
+                    self.root.after(0, self.status_var.set, f"Copying files... {progress_count} copied")
+                    
+            # Plan first so blobs shared by several selected models are copied only once
+            # Base folders are joined once; per-blob paths are plain concatenation
+            src_blobs_dir = os.path.join(src_path, "blobs")
+            dest_blobs_dir = os.path.join(dest_path, "blobs")
+            dest_manifests_dir = os.path.join(dest_path, "manifests", "registry.ollama.ai", "library")
+            copy_plan = set()      # (src, dest) blob paths
+            manifest_plan = {}     # (src, dest) manifest paths -> ("model:version", blob pairs it needs)
+            
+            for item, item_text, parent_text, grandparent_text in selection:
                 # Determine what level we're copying from
-                if not parent:  # Root node - copy entire model
+                if parent_text is None:  # Root node - copy entire model
                     model_name = item_text
-                    if model_name in models:
-                        for version, version_data in models[model_name]['versions'].items():
-                            copied_count += self._copy_model_version(src_path, dest_path, model_name, version, version_data)
-                            copied_models.add(f"{model_name}:{version}")
+                    model_idx = models.model_ids.get(model_name)
+                    if model_idx is not None:
+                        for version_idx in models.versions(model_idx):
+                            self._plan_model_version(src_blobs_dir, dest_blobs_dir, dest_manifests_dir,
+                                                     models, model_idx, version_idx, copy_plan, manifest_plan)
                             
-                elif not grandparent:  # Version node - copy specific version
-                    model_name = tree.item(parent, 'text')
+                elif grandparent_text is None:  # Version node - copy specific version
+                    model_name = parent_text
                     version = item_text
-                    if model_name in models and version in models[model_name]['versions']:
-                        version_data = models[model_name]['versions'][version]
-                        copied_count += self._copy_model_version(src_path, dest_path, model_name, version, version_data)
-                        copied_models.add(f"{model_name}:{version}")
+                    model_idx = models.model_ids.get(model_name)
+                    version_idx = models.find_version(model_idx, version) if model_idx is not None else None
+                    if version_idx is not None:
+                        self._plan_model_version(src_blobs_dir, dest_blobs_dir, dest_manifests_dir,
+                                                 models, model_idx, version_idx, copy_plan, manifest_plan)
                         
                 else:  # Individual blob file
                     blob_name = item_text
-                    src_blob_path = os.path.join(src_path, "blobs", blob_name)
-                    dest_blob_path = os.path.join(dest_path, "blobs", blob_name)
+                    copy_plan.add((f"{src_blobs_dir}{os.sep}{blob_name}", f"{dest_blobs_dir}{os.sep}{blob_name}"))
                     
-                    if os.path.exists(src_blob_path):
-                        os.makedirs(os.path.dirname(dest_blob_path), exist_ok=True)
-                        shutil.copy2(src_blob_path, dest_blob_path)
-                        copied_count += 1
-                        
+            # Blobs go first so a copied manifest never points at blobs that aren't there yet
+            if copy_plan:
+                os.makedirs(dest_blobs_dir, exist_ok=True)
+            ready, copied_count, failed_count = self._copy_blobs(copy_plan, progress)
+            
+            copied_models = set()
+            skipped_models = set()
+            for (src_manifest, dest_manifest), (model_version, needed_blobs) in manifest_plan.items():
+                # A manifest whose blobs didn't all make it (failed, or missing from the
+                # source - shown with ✗) would leave a broken model behind
+                if not needed_blobs <= ready:
+                    log.warning("skipped %s: %d of its blobs are not at the destination",
+                                src_manifest, len(needed_blobs - ready))
+                    skipped_models.add(model_version)
+                    continue
+                try:
+                    os.makedirs(os.path.dirname(dest_manifest), exist_ok=True)
+                    shutil.copy2(src_manifest, dest_manifest)
+                except OSError as e:
+                    log.warning("copy failed %s: %s", src_manifest, e)
+                    failed_count += 1
+                    continue
+                copied_models.add(model_version)
+                
             models_text = f" ({len(copied_models)} models)" if copied_models else ""
-            self.root.after(0, lambda: self.status_var.set(f"Copied {copied_count} files{models_text}"))
+            skipped_text = f", {len(skipped_models)} models skipped (missing blobs)" if skipped_models else ""
+            failed_text = f", {failed_count} failed" if failed_count else ""
+            self.root.after(0, lambda: self.status_var.set(
+                f"Copied {copied_count} files{models_text}{skipped_text}{failed_text}"))
             
             # Refresh destination pane
             dest_pane = 'right' if from_pane == 'left' else 'left'
@@ -417,34 +867,53 @@ class OllamaModelManager:
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Copy Error", f"Error copying files: {str(e)}"))
             
-    def _copy_model_version(self, src_path, dest_path, model_name, version, version_data):
-        """Copy a complete model version including manifest and blobs"""
-        copied_count = 0
+    def _plan_model_version(self, src_blobs_dir, dest_blobs_dir, dest_manifests_dir,
+                            models, model_idx, version_idx, copy_plan, manifest_plan):
+        """Add a complete model version (manifest and blobs) to the copy plans"""
+        model_name = models.model_names[model_idx]
+        version = models.version_names[version_idx]
         
-        try:
-            # Copy manifest file
-            src_manifest = version_data['manifest_path']
-            dest_manifest_dir = os.path.join(dest_path, "manifests", "registry.ollama.ai", "library", model_name)
-            dest_manifest_path = os.path.join(dest_manifest_dir, version)
-            
-            os.makedirs(dest_manifest_dir, exist_ok=True)
-            shutil.copy2(src_manifest, dest_manifest_path)
-            
-            # Copy all blobs for this version
-            for blob_info in version_data['blobs']:
-                blob_name = blob_info['name']
-                src_blob_path = os.path.join(src_path, "blobs", blob_name)
-                dest_blob_path = os.path.join(dest_path, "blobs", blob_name)
-                
-                if os.path.exists(src_blob_path):
-                    os.makedirs(os.path.dirname(dest_blob_path), exist_ok=True)
-                    shutil.copy2(src_blob_path, dest_blob_path)
-                    copied_count += 1
-                    
-        except Exception as e:
-            print(f"Error copying {model_name}:{version}: {e}")
+        dest_manifest_path = f"{dest_manifests_dir}{os.sep}{model_name}{os.sep}{version}"
+        _, needed_blobs = manifest_plan.setdefault((models.manifest_paths[version_idx], dest_manifest_path),
+                                                   (f"{model_name}:{version}", set()))
+        
+        for blob_idx in models.blobs(version_idx):
+            blob_name = models.blob_names[blob_idx]
+            blob_pair = (f"{src_blobs_dir}{os.sep}{blob_name}", f"{dest_blobs_dir}{os.sep}{blob_name}")
+            copy_plan.add(blob_pair)
+            needed_blobs.add(blob_pair)
             
-        return copied_count
+    def _copy_blobs(self, copy_plan, progress):
+        """Copy planned blobs several at a time.
+        
+        Returns (ready, copied, failed): ready holds the blob pairs now present at the
+        destination, either copied or already there when the source was missing.
+        """
+        def copy_blob(src_blob_path, dest_blob_path):
+            if not os.path.exists(src_blob_path):
+                return False
+            _fast_copy(src_blob_path, dest_blob_path)
+            return True
+            
+        ready = set()
+        copied_count = failed_count = 0
+        futures = {self._copy_pool.submit(copy_blob, src, dest): (src, dest) for src, dest in copy_plan}
+        for future in concurrent.futures.as_completed(futures):
+            blob_pair = futures[future]
+            try:
+                copied = future.result()
+            except OSError as e:
+                log.warning("copy failed %s: %s", blob_pair[0], e)
+                failed_count += 1
+                continue
+            if copied:
+                ready.add(blob_pair)
+                copied_count += 1
+                progress()
+            elif os.path.exists(blob_pair[1]):
+                ready.add(blob_pair)
+                
+        return ready, copied_count, failed_count
             
     def delete_selected(self, pane=None):
         if pane is None:
@@ -469,27 +938,23 @@ class OllamaModelManager:
             return
             
         self.status_var.set("Deleting files...")
-        self.root.update()
+        self.root.update_idletasks()
         
-        # Run delete operation in thread
-        thread = threading.Thread(target=self._delete_files_thread, args=(pane, selected))
-        thread.daemon = True
-        thread.start()
+        # Run delete operation in worker pool
+        selection = self._snapshot_selection(pane, selected)
+        self._io_pool.submit(self._delete_files_thread, pane, selection)
         
-    def _delete_files_thread(self, pane, selected_items):
+    def _delete_files_thread(self, pane, selection):
         try:
             src_path = self.left_path.get() if pane == 'left' else self.right_path.get()
-            tree = self.left_tree if pane == 'left' else self.right_tree
+            blobs_dir = os.path.join(src_path, "blobs")
             
             deleted_count = 0
             
-            for item in selected_items:
-                item_text = tree.item(item, 'text')
-                parent = tree.parent(item)
-                
-                if parent:  # This is a blob file
+            for item, item_text, parent_text, _ in selection:
+                if parent_text is not None:  # This is a blob file
                     blob_name = item_text
-                    blob_path = os.path.join(src_path, "blobs", blob_name)
+                    blob_path = f"{blobs_dir}{os.sep}{blob_name}"
                     
                     if os.path.exists(blob_path):
                         os.remove(blob_path)
@@ -522,6 +987,17 @@ class OllamaModelManager:
         
         # Properties text widget
         props_text = tk.Text(props_window, wrap=tk.WORD)
+        
+        pane_path = self.left_path.get() if pane == 'left' else self.right_path.get()
+        parent = tree.parent(item)
+        
+        # Blob nodes can be hashed on demand
+        if parent and tree.parent(parent):
+            blob_path = os.path.join(pane_path, "blobs", item_text)
+            verify_button = ttk.Button(props_window, text="Verify")
+            verify_button.config(command=lambda: self.verify_blob(blob_path, props_text, verify_button))
+            verify_button.pack(side=tk.BOTTOM, pady=(0, 10))
+            
         props_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Get detailed info
@@ -529,12 +1005,47 @@ class OllamaModelManager:
         props_info += f"Size: {item_values[0] if item_values else 'N/A'}\n"
         props_info += f"Status: {item_values[1] if len(item_values) > 1 else 'N/A'}\n"
         props_info += f"Pane: {pane.capitalize()}\n"
-        props_info += f"Path: {self.left_path.get() if pane == 'left' else self.right_path.get()}\n"
+        props_info += f"Path: {pane_path}\n"
         
         props_text.insert(tk.END, props_info)
         props_text.config(state=tk.DISABLED)
+        
+    def verify_blob(self, blob_path, props_text, verify_button):
+        verify_button.config(state=tk.DISABLED)
+        self.status_var.set(f"Verifying {os.path.basename(blob_path)}...")
+        
+        # Hashing multi-GB blobs takes a while - keep it off the UI thread
+        future = self._io_pool.submit(_verify_blob, blob_path)
+        future.add_done_callback(lambda f: self.root.after(0, self._show_verify_result, f, props_text, verify_button))
+        
+    def _show_verify_result(self, future, props_text, verify_button):
+        try:
+            result = "OK" if future.result() else "Digest mismatch"
+        except OSError as e:
+            result = f"Error: {e}"
+            
+        self.status_var.set(f"Verify: {result}")
+        
+        # The properties window may have been closed meanwhile
+        if props_text.winfo_exists():
+            props_text.config(state=tk.NORMAL)
+            props_text.insert(tk.END, f"Verified: {result}\n")
+            props_text.config(state=tk.DISABLED)
+            verify_button.config(state=tk.NORMAL)
+        
+    def on_close(self):
+        for observer in self._observers.values():
+            if observer is not None:
+                observer.stop()
+                
+        # Drop queued work; running tasks finish in the background
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._copy_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 def main():
+    # Stay quiet unless the embedding environment configures logging
+    logging.getLogger().addHandler(logging.NullHandler())
     root = tk.Tk()
     app = OllamaModelManager(root)
     root.mainloop()